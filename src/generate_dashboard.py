@@ -6,49 +6,189 @@ Fetches data from various sources and generates a static HTML dashboard
 
 import os
 import sys
-import json
+import gzip
+import queue
+import calendar
+import atexit
+import hashlib
 import logging
+import logging.handlers
 import shutil
+import subprocess
+import time
+import wsgiref.simple_server
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import orjson
 import requests
-import feedparser
-from jinja2 import Environment, FileSystemLoader
-from dotenv import load_dotenv
+import requests_cache
+from requests.adapters import HTTPAdapter
+import fastfeedparser
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
+import httplib2
+from google.auth.exceptions import RefreshError, TransportError
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 
-# Load environment variables
-load_dotenv()
+# Load environment variables from .env unless the service manager (docker compose) already provided them
+_dotenv_skipped = 'OPENWEATHER_API_KEY' in os.environ
+if not _dotenv_skipped:
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # Ensure logs directory exists
 Path('logs').mkdir(exist_ok=True)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/dashboard.log'),
-        logging.StreamHandler()
-    ]
-)
+# Configure logging; records are queued and written to file/console by a background thread
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.FileHandler('logs/dashboard.log'),
+    logging.StreamHandler()
+]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+queue_handler = logging.handlers.QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 logger = logging.getLogger(__name__)
+if _dotenv_skipped:
+    logger.info("OPENWEATHER_API_KEY already set; skipped loading .env (other variables come from the environment only)")
+
+# User-Agent sent when downloading RSS feeds
+RSS_USER_AGENT = 'pi-dashboard/1.0 (+https://github.com/francojc/pi-dashboard)'
+
+# Shared keep-alive session for uncached API calls (Canvas, Mapbox) so TLS connections are reused
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Calendar name lookups (weekday() / month - 1 indexed)
+_DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_DAY_ABBR = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_FORECAST_DAY_NAMES = ('MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN')
+_MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June',
+                'July', 'August', 'September', 'October', 'November', 'December')
+
+# Single cell of the month calendar grid
+CalendarDay = namedtuple('CalendarDay', 'number is_today is_other_month')
+
+# Weather settings overridden from the environment (read once at startup)
+WEATHER_ENV_OVERRIDES = {
+    key: value for key, value in (
+        ('api_key', os.getenv('OPENWEATHER_API_KEY')),
+        ('location', os.getenv('WEATHER_LOCATION')),
+        ('units', os.getenv('WEATHER_UNITS')),
+    ) if value
+}
+
+# Installed-app OAuth client for first-time Calendar authorization (read once at startup).
+# The callback port must match the redirect URI registered in Google Cloud Console;
+# PORT is the nginx port, so the OAuth callback has its own setting.
+def _oauth_callback_port(default: int = 8081) -> int:
+    """OAUTH_CALLBACK_PORT from the environment, falling back to the default when blank or invalid"""
+    value = os.getenv('OAUTH_CALLBACK_PORT', '').strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Invalid OAUTH_CALLBACK_PORT {value!r}, using {default}")
+        return default
+
+
+OAUTH_CALLBACK_PORT = _oauth_callback_port()
+GOOGLE_CLIENT_CONFIG = {
+    "installed": {
+        "client_id": os.getenv('GOOGLE_CALENDAR_CLIENT_ID'),
+        "client_secret": os.getenv('GOOGLE_CALENDAR_CLIENT_SECRET'),
+        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
+        "redirect_uris": [f"http://localhost:{OAUTH_CALLBACK_PORT}"],
+    }
+}
+
+
+class _ReusableWSGIServer(wsgiref.simple_server.WSGIServer):
+    """OAuth callback server that can rebind a port left in TIME_WAIT by a previous attempt"""
+    allow_reuse_address = True
+
+
+@contextmanager
+def _reusable_oauth_callback():
+    """Make InstalledAppFlow.run_local_server bind its callback server with SO_REUSEADDR
+
+    google-auth-oauthlib turns address reuse off, so re-running within a minute of a previous
+    attempt fails to bind. On Linux SO_REUSEADDR still refuses a port another socket is listening on.
+    """
+    make_server = wsgiref.simple_server.make_server
+    wsgiref.simple_server.make_server = partial(make_server, server_class=_ReusableWSGIServer)
+    try:
+        yield
+    finally:
+        wsgiref.simple_server.make_server = make_server
+
+
+@lru_cache(maxsize=8)
+def _build_month_days(year: int, month: int, today: int) -> Tuple[CalendarDay, ...]:
+    """Month grid padded with previous/next month days; cached since it only changes daily"""
+    # Weekday of the 1st (Monday = 0) is the number of leading days from the previous month
+    leading_days, days_in_month = calendar.monthrange(year, month)
+    prev_year, prev_month = (year - 1, 12) if month == 1 else (year, month - 1)
+    prev_month_days = calendar.monthrange(prev_year, prev_month)[1]
+
+    # Pad the grid out to whole weeks with days from the next month
+    total_cells = -(-(leading_days + days_in_month) // 7) * 7
+    trailing_days = total_cells - leading_days - days_in_month
+
+    return (
+        tuple(CalendarDay(day, False, True) for day in range(prev_month_days - leading_days + 1, prev_month_days + 1))
+        + tuple(CalendarDay(day, day == today, False) for day in range(1, days_in_month + 1))
+        + tuple(CalendarDay(day, False, True) for day in range(1, trailing_days + 1))
+    )
+
+
+def _iso_time(value: str) -> str:
+    """Extract HH:MM from an ISO 8601 date-time without building a datetime"""
+    hhmm = value[11:16]
+    if hhmm[:2].isdigit() and hhmm[2:3] == ':' and hhmm[3:].isdigit():
+        return hhmm
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).strftime('%H:%M')
 
 
 class GoogleCalendarService:
     """Service for Google Calendar API interactions"""
 
-    SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
+    # Changing the scopes invalidates the cached token.json and forces a new browser authorization
+    SCOPES = ('https://www.googleapis.com/auth/calendar.readonly',)
 
-    def __init__(self):
+    # Page size for the Monday-Sunday week view
+    WEEK_MAX_RESULTS = 50
+
+    # Socket timeout and retry count for Calendar API calls (the client library defaults to 60s, no retries)
+    HTTP_TIMEOUT = 10
+    NUM_RETRIES = 2
+
+    def __init__(self, event_cache_ttl: float = 1350):
         self.credentials = None
         self.service = None
+        self._event_cache = {}
+        # Seconds to reuse a fetched event window before asking the API again
+        self.event_cache_ttl = event_cache_ttl
         self._authenticate()
 
     def _authenticate(self):
@@ -60,67 +200,169 @@ class GoogleCalendarService:
 
         # Load existing credentials
         if os.path.exists(creds_file):
-            self.credentials = Credentials.from_authorized_user_file(creds_file, self.SCOPES)
+            self.credentials = Credentials.from_authorized_user_info(orjson.loads(creds_file.read_bytes()), self.SCOPES)
 
         # If credentials are invalid or don't exist, get new ones
         if not self.credentials or not self.credentials.valid:
             if self.credentials and self.credentials.expired and self.credentials.refresh_token:
                 try:
-                    self.credentials.refresh(Request())
-                except Exception as e:
+                    self.credentials.refresh(Request(session=HTTP_SESSION))
+                except (RefreshError, TransportError) as e:
                     logger.warning(f"Failed to refresh credentials: {e}")
                     self.credentials = None
+                else:
+                    # Persist the refreshed token so the next start can skip the refresh round-trip;
+                    # a failed write must not discard the working credentials
+                    try:
+                        self._save_credentials(creds_file)
+                    except OSError as e:
+                        logger.warning(f"Failed to save refreshed credentials: {e}")
 
             if not self.credentials:
                 # Check for required environment variables
-                client_id = os.getenv('GOOGLE_CALENDAR_CLIENT_ID')
-                client_secret = os.getenv('GOOGLE_CALENDAR_CLIENT_SECRET')
+                client_id = GOOGLE_CLIENT_CONFIG['installed']['client_id']
 
-                if not client_id or not client_secret:
+                if not client_id or not GOOGLE_CLIENT_CONFIG['installed']['client_secret']:
                     logger.warning("Google Calendar credentials not configured - using mock calendar data")
                     logger.info("To enable Google Calendar, set GOOGLE_CALENDAR_CLIENT_ID and GOOGLE_CALENDAR_CLIENT_SECRET")
                     self.service = None
                     return
 
-                # Create proper client configuration for installed app
-                client_config = {
-                    "installed": {
-                        "client_id": client_id,
-                        "client_secret": client_secret,
-                        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                        "token_uri": "https://oauth2.googleapis.com/token",
-                        "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
-                        "redirect_uris": [f"http://localhost:{os.getenv('PORT', '8081')}"],
-                    }
-                }
-
                 try:
-                    flow = InstalledAppFlow.from_client_config(client_config, self.SCOPES)
-                    # Use port from environment variable
-                    port = int(os.getenv('PORT', '8081'))
-                    logger.info("Starting OAuth flow - please complete authorization in your browser")
-                    self.credentials = flow.run_local_server(port=port, open_browser=True)
+                    # Only needed for first-time authorization, so keep oauthlib off the normal startup path
+                    from google_auth_oauthlib.flow import InstalledAppFlow
+
+                    flow = InstalledAppFlow.from_client_config(GOOGLE_CLIENT_CONFIG, self.SCOPES)
+
+                    # Over SSH or on a Pi without a desktop session there is no browser to launch
+                    # (webbrowser raises), so only print the URL for use on another machine
+                    headless = 'SSH_CONNECTION' in os.environ or (
+                        sys.platform.startswith('linux')
+                        and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+                    )
+                    if headless:
+                        logger.info("No display detected - open the URL below in a browser on another machine "
+                                    f"(forward the callback with: ssh -L {OAUTH_CALLBACK_PORT}:localhost:{OAUTH_CALLBACK_PORT} <pi>)")
+                    else:
+                        logger.info("Starting OAuth flow - please complete authorization in your browser")
+
+                    with _reusable_oauth_callback():
+                        self.credentials = flow.run_local_server(
+                            port=OAUTH_CALLBACK_PORT,
+                            bind_addr='127.0.0.1',
+                            open_browser=not headless,
+                            timeout_seconds=120
+                        )
                     logger.info("OAuth flow completed successfully")
 
                     # Save credentials for next run
-                    with open(creds_file, 'w') as token:
-                        token.write(self.credentials.to_json())
+                    self._save_credentials(creds_file)
 
                 except Exception as e:
                     logger.error(f"OAuth flow failed: {e}")
-                    port = os.getenv('PORT', '8081')
-                    logger.error(f"Make sure http://localhost:{port} is registered as a redirect URI in Google Cloud Console")
-                    logger.error(f"OAuth client config: client_id ends with ...{client_id[-10:] if client_id and len(client_id) > 10 else 'N/A'}")
+                    logger.error(f"Make sure http://localhost:{OAUTH_CALLBACK_PORT} is registered as a redirect URI in Google Cloud Console")
+                    # Client IDs all end in .apps.googleusercontent.com; the leading project number identifies them
+                    logger.error(f"OAuth client config: client_id starts with {client_id[:8]}...")
                     raise
 
         if self.credentials:
             try:
-                self.service = build('calendar', 'v3', credentials=self.credentials)
+                # One authorized keep-alive transport, reused for every Calendar call this process makes
+                http = AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=self.HTTP_TIMEOUT))
+                # Use the discovery document bundled with the client library; no network fetch or cache probe
+                self.service = build('calendar', 'v3', http=http, static_discovery=True, cache_discovery=False)
                 logger.info("Google Calendar service initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to build calendar service: {e}")
                 self.service = None
 
+    def _save_credentials(self, creds_file: Path):
+        """Write the current credentials to token.json atomically, readable only by the owner"""
+        token_bytes = self.credentials.to_json().encode()
+        tmp_file = creds_file.with_name(creds_file.name + '.tmp')
+        try:
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as token:
+                token.write(token_bytes)
+                token.flush()
+                os.fsync(token.fileno())
+            os.replace(tmp_file, creds_file)
+        except OSError as e:
+            # docker compose bind-mounts token.json as a single file, which cannot be renamed over
+            logger.debug(f"Atomic token write failed ({e}), writing token.json in place")
+            tmp_file.unlink(missing_ok=True)
+            creds_file.write_bytes(token_bytes)
+            os.chmod(creds_file, 0o600)
+
+    @staticmethod
+    def days_ahead_window(days: int) -> tuple:
+        """UTC (timeMin, timeMax) from the start of today through the given number of days ahead"""
+        start_of_today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        return start_of_today.isoformat() + 'Z', (start_of_today + timedelta(days=days)).isoformat() + 'Z'
+
+    @staticmethod
+    def week_window() -> tuple:
+        """(timeMin, timeMax) covering Monday through Sunday of the current week"""
+        now = datetime.now()
+        monday = (now - timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+        sunday = monday + timedelta(days=6, hours=23, minutes=59, seconds=59)
+        return monday.replace(tzinfo=timezone.utc).isoformat(), sunday.replace(tzinfo=timezone.utc).isoformat()
+
+    def _get_cached_events(self, key: tuple) -> Optional[List[Dict]]:
+        """Return cached items for an event window if they are still fresh"""
+        cached = self._event_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.event_cache_ttl:
+            return cached[1]
+        return None
+
+    def _store_events(self, key: tuple, items: List[Dict]) -> None:
+        """Cache items for an event window, dropping expired windows (e.g. yesterday's)"""
+        now = time.monotonic()
+        self._event_cache = {k: v for k, v in self._event_cache.items()
+                             if now - v[0] < self.event_cache_ttl}
+        self._event_cache[key] = (now, items)
+
+    def _events_request(self, calendar_id: str, time_min: str, time_max: str, max_results: int):
+        """Build an events().list request for a time window"""
+        return self.service.events().list(
+            calendarId=calendar_id,
+            timeMin=time_min,
+            timeMax=time_max,
+            maxResults=max_results,
+            singleEvents=True,
+            orderBy='startTime'
+        )
+
+    def list_events(self, calendar_id: str, time_min: str, time_max: str, max_results: int) -> List[Dict]:
+        """List raw events for a time window, reusing recent results for the same window"""
+        key = (calendar_id, time_min, time_max, max_results)
+        items = self._get_cached_events(key)
+        if items is not None:
+            logger.debug(f"Using cached events for calendar {calendar_id}")
+            return items
+
+        items = self._events_request(*key).execute(num_retries=self.NUM_RETRIES).get('items', [])
+        self._store_events(key, items)
+        return items
+
+    def prefetch_events(self, windows: List[tuple]) -> None:
+        """Fetch uncached (calendar_id, time_min, time_max, max_results) windows in one batched HTTP request"""
+        pending = [key for key in dict.fromkeys(windows) if self._get_cached_events(key) is None]
+        if len(pending) < 2:
+            return  # a batch only pays off for two or more requests
+
+        def store(request_id, response, exception):
+            if exception is not None:
+                logger.warning(f"Batched calendar request failed: {exception}")
+            else:
+                self._store_events(pending[int(request_id)], response.get('items', []))
+
+        batch = self.service.new_batch_http_request(callback=store)
+        for i, key in enumerate(pending):
+            batch.add(self._events_request(*key), request_id=str(i))
+        batch.execute()
+        logger.info(f"Prefetched {len(pending)} calendar event windows in one batch request")
+
     def get_events(self, calendar_id='primary', max_results=20, calendar_name=None, calendar_color=None) -> List[Dict]:
         """Fetch upcoming events from Google Calendar (start of today through next 7 days)"""
         if not self.service:
@@ -129,20 +371,7 @@ class GoogleCalendarService:
 
         try:
             # Get events from start of today to 7 days ahead to capture all-day events and future events
-            now = datetime.utcnow()
-            start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            seven_days_ahead = start_of_today + timedelta(days=7)
-
-            events_result = self.service.events().list(
-                calendarId=calendar_id,
-                timeMin=start_of_today.isoformat() + 'Z',
-                timeMax=seven_days_ahead.isoformat() + 'Z',
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-
-            events = events_result.get('items', [])
+            events = self.list_events(calendar_id, *self.days_ahead_window(7), max_results)
             formatted_events = []
 
             for event in events:
@@ -151,10 +380,8 @@ class GoogleCalendarService:
 
                 # Parse datetime
                 if 'T' in start:
-                    start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                    start_time = start_dt.strftime('%H:%M')
-                    end_time = end_dt.strftime('%H:%M')
+                    start_time = _iso_time(start)
+                    end_time = _iso_time(end)
                 else:
                     # All-day event
                     start_time = 'All Day'
@@ -190,34 +417,19 @@ class GoogleCalendarService:
             monday = now - timedelta(days=now.weekday())
             monday = monday.replace(hour=0, minute=0, second=0, microsecond=0)
 
-            # Calculate Sunday (end of week)
-            sunday = monday + timedelta(days=6, hours=23, minutes=59, seconds=59)
-
-            # Convert to UTC for API call
-            monday_utc = monday.replace(tzinfo=timezone.utc)
-            sunday_utc = sunday.replace(tzinfo=timezone.utc)
-
-            events_result = self.service.events().list(
-                calendarId=calendar_id,
-                timeMin=monday_utc.isoformat(),
-                timeMax=sunday_utc.isoformat(),
-                maxResults=50,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-
-            events = events_result.get('items', [])
+            events = self.list_events(calendar_id, *self.week_window(), self.WEEK_MAX_RESULTS)
             week_events = {}
+            today = now.date()
 
             # Initialize week structure
             for i in range(7):
                 day = monday + timedelta(days=i)
-                date_key = day.strftime('%Y-%m-%d')
-                week_events[date_key] = {
+                day_date = day.date()
+                week_events[day_date.isoformat()] = {
                     'date': day,
-                    'day_name': ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'][i],
+                    'day_name': _DAY_ABBR[i],
                     'day_number': day.day,
-                    'is_today': day.date() == now.date(),
+                    'is_today': day_date == today,
                     'all_day': [],
                     'timed': []
                 }
@@ -229,15 +441,13 @@ class GoogleCalendarService:
 
                 # Determine event date
                 if 'T' in start:
-                    # Timed event
-                    start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                    event_date = start_dt.date()
+                    # Timed event: slice date and HH:MM from the ISO string (event's own offset)
+                    event_date = datetime.fromisoformat(start[:10]).date()
 
                     event_data = {
                         'summary': event.get('summary', 'Untitled Event'),
-                        'start': start_dt.strftime('%H:%M'),
-                        'end': end_dt.strftime('%H:%M'),
+                        'start': _iso_time(start),
+                        'end': _iso_time(end),
                         'location': event.get('location', ''),
                         'type': 'timed',
                         'calendar_name': calendar_name or 'Calendar',
@@ -245,7 +455,7 @@ class GoogleCalendarService:
                         'calendar_id': calendar_id
                     }
 
-                    date_key = event_date.strftime('%Y-%m-%d')
+                    date_key = event_date.isoformat()
                     if date_key in week_events:
                         week_events[date_key]['timed'].append(event_data)
                 else:
@@ -261,7 +471,7 @@ class GoogleCalendarService:
                         'calendar_id': calendar_id
                     }
 
-                    date_key = event_date.strftime('%Y-%m-%d')
+                    date_key = event_date.isoformat()
                     if date_key in week_events:
                         week_events[date_key]['all_day'].append(event_data)
 
@@ -279,26 +489,15 @@ class GoogleCalendarService:
 
         try:
             # Get events from start of today to 5 days ahead
-            now = datetime.utcnow()
-            start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            five_days_ahead = start_of_today + timedelta(days=5)
-
-            events_result = self.service.events().list(
-                calendarId=calendar_id,
-                timeMin=start_of_today.isoformat() + 'Z',
-                timeMax=five_days_ahead.isoformat() + 'Z',
-                maxResults=50,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-
-            events = events_result.get('items', [])
+            events = self.list_events(calendar_id, *self.days_ahead_window(5), 50)
             agenda = []
+            local_now = datetime.now()
+            today = local_now.date()
 
             # Initialize agenda structure for next 5 days
             for i in range(5):
-                day = datetime.now() + timedelta(days=i)
-                day_name = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'][day.weekday()]
+                day = local_now + timedelta(days=i)
+                day_name = _DAY_NAMES[day.weekday()]
 
                 if i == 0:
                     display_name = 'Today'
@@ -323,15 +522,13 @@ class GoogleCalendarService:
 
                 # Determine event date
                 if 'T' in start:
-                    # Timed event
-                    start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                    event_date = start_dt.date()
+                    # Timed event: slice date and HH:MM from the ISO string (event's own offset)
+                    event_date = datetime.fromisoformat(start[:10]).date()
 
                     event_data = {
                         'summary': event.get('summary', 'Untitled Event'),
-                        'start': start_dt.strftime('%H:%M'),
-                        'end': end_dt.strftime('%H:%M'),
+                        'start': _iso_time(start),
+                        'end': _iso_time(end),
                         'type': 'timed'
                     }
                 else:
@@ -346,7 +543,6 @@ class GoogleCalendarService:
                     }
 
                 # Find the matching agenda day
-                today = datetime.now().date()
                 days_ahead = (event_date - today).days
 
                 if 0 <= days_ahead < 5:
@@ -385,10 +581,10 @@ class CanvasService:
         
         try:
             url = f"{self.base_url}/{endpoint.lstrip('/')}"
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = HTTP_SESSION.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Canvas API request failed: {e}")
             return None
     
@@ -1070,10 +1266,10 @@ class MapboxService:
             }
             
             logger.debug(f"Requesting travel times from Mapbox Matrix API")
-            response = requests.get(matrix_url, params=params, timeout=10)
+            response = HTTP_SESSION.get(matrix_url, params=params, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
             if 'durations' not in data or not data['durations']:
                 logger.warning("No duration data in Mapbox response")
@@ -1156,7 +1352,25 @@ class MapboxService:
 class DashboardGenerator:
     """Main dashboard generator class"""
 
-    def __init__(self, config_path: Optional[str] = None):
+    # Template fields that change every run without changing the rendered content
+    VOLATILE_TEMPLATE_KEYS = ('current_time', 'last_updated', 'cache_buster')
+
+    # Worker threads for concurrent data fetching (all sources are network-bound)
+    FETCH_WORKERS = 8
+
+    # Cap on concurrent RSS downloads; this pool runs inside one of the fetch workers
+    RSS_FETCH_WORKERS = 4
+
+    # Per-source HTTP cache lifetimes in seconds (upstream Cache-Control headers take precedence)
+    HTTP_CACHE_EXPIRY = {
+        'api.openweathermap.org/geo': 86400,
+        'api.openweathermap.org/data/2.5/forecast': 3600,
+        'api.openweathermap.org/data/2.5/weather': 600,
+        'api.openweathermap.org/data/2.5/air_pollution': 600,
+    }
+    RSS_CACHE_EXPIRY = 900
+
+    def __init__(self, config_path: Optional[str] = None, refresh_interval: int = 900):
         """Initialize the dashboard generator with configuration"""
         # Set up paths relative to script location for container compatibility
         script_dir = Path(__file__).resolve().parent
@@ -1174,11 +1388,45 @@ class DashboardGenerator:
         self.output_dir.mkdir(exist_ok=True)
         self.output_static_dir = self.output_dir / "static"
         self.output_static_dir.mkdir(exist_ok=True)
+        # Static assets ship with the code, so enumerate them once rather than on every refresh
+        self._static_files = [path for path in self.static_dir.glob('*') if path.is_file()]
+        self.cache_dir = project_root / "cache"
         self.test_mode = False  # Will be set by command line args
+        self._last_stable_hash = None
+        self._last_render_ts = None
+        self._mock_week_cache = (None, None)
+
+        # HTTP cache for upstream APIs; honors Cache-Control/ETag and serves stale data on errors
+        self._session = requests_cache.CachedSession(
+            str(self.cache_dir / 'http'),
+            expire_after=600,
+            urls_expire_after=self.HTTP_CACHE_EXPIRY,
+            cache_control=True,
+            stale_if_error=True,
+            ignored_parameters=['appid']  # keep the OpenWeather key out of http.sqlite
+        )
+
+        # Build the template environment once so the compiled template is reused across renders.
+        # Feed titles and event text come from third parties, so HTML output is autoescaped.
+        self._jinja_env = Environment(
+            loader=FileSystemLoader(self.template_dir),
+            bytecode_cache=self._create_bytecode_cache(),
+            autoescape=select_autoescape(['html']),
+            auto_reload=False,
+            optimized=True,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            cache_size=50
+        )
+        self._dashboard_template = self._jinja_env.get_template('dashboard.html')
+        self._time_strip_template = self._jinja_env.get_template('time_strip.json')
+
         self.calendar_service = None
         if not self.config.get('calendar', {}).get('use_mock_data', True):
             try:
-                self.calendar_service = GoogleCalendarService()
+                # 1.5x the refresh interval: every other render reuses the fetched events and the
+                # next one refetches, so calendar edits show up within two intervals at most
+                self.calendar_service = GoogleCalendarService(event_cache_ttl=refresh_interval * 1.5)
             except Exception as e:
                 logger.warning(f"Failed to initialize Google Calendar service: {e}")
         
@@ -1202,11 +1450,20 @@ class DashboardGenerator:
         except Exception as e:
             logger.warning(f"Failed to initialize Canvas service: {e}")
 
+    def _create_bytecode_cache(self) -> Optional[FileSystemBytecodeCache]:
+        """Create an on-disk Jinja bytecode cache so cold starts skip template compilation"""
+        try:
+            jinja_cache_dir = self.cache_dir / "jinja"
+            jinja_cache_dir.mkdir(parents=True, exist_ok=True)
+            return FileSystemBytecodeCache(str(jinja_cache_dir))
+        except OSError as e:
+            logger.warning(f"Jinja bytecode cache disabled: {e}")
+            return None
+
     def _load_config(self, config_path: str) -> dict:
         """Load configuration from JSON file"""
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config = orjson.loads(Path(config_path).read_bytes())
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
             config = {}
@@ -1216,12 +1473,7 @@ class DashboardGenerator:
             config['weather'] = {}
 
         # Override with environment variables if present
-        if os.getenv('OPENWEATHER_API_KEY'):
-            config['weather']['api_key'] = os.getenv('OPENWEATHER_API_KEY')
-        if os.getenv('WEATHER_LOCATION'):
-            config['weather']['location'] = os.getenv('WEATHER_LOCATION')
-        if os.getenv('WEATHER_UNITS'):
-            config['weather']['units'] = os.getenv('WEATHER_UNITS')
+        config['weather'].update(WEATHER_ENV_OVERRIDES)
 
         return config
 
@@ -1328,9 +1580,9 @@ class DashboardGenerator:
                 'limit': 1
             }
 
-            geo_response = requests.get(geocoding_url, params=geo_params, timeout=10)
+            geo_response = self._session.get(geocoding_url, params=geo_params, timeout=10)
             geo_response.raise_for_status()
-            geo_data = geo_response.json()
+            geo_data = orjson.loads(geo_response.content)
 
             if not geo_data:
                 logger.warning(f"Could not find coordinates for location: {location}")
@@ -1347,9 +1599,9 @@ class DashboardGenerator:
                 'units': config.get('units', os.getenv('WEATHER_UNITS', 'imperial'))
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             current = data['main']
 
@@ -1405,9 +1657,9 @@ class DashboardGenerator:
                 'units': config.get('units', os.getenv('WEATHER_UNITS', 'imperial'))
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Convert wind speed based on units
             units = config.get('units', os.getenv('WEATHER_UNITS', 'imperial'))
@@ -1432,7 +1684,7 @@ class DashboardGenerator:
                 'alerts': [],  # No alerts in fallback
                 'hourly_forecast': None  # No hourly data in fallback
             }
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Fallback weather fetch failed: {e}")
             return None
 
@@ -1489,9 +1741,9 @@ class DashboardGenerator:
                 'units': config.get('units', os.getenv('WEATHER_UNITS', 'imperial'))
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             hourly_forecast = []
             local_tz = self._get_configured_timezone()
@@ -1579,7 +1831,7 @@ class DashboardGenerator:
 
         for i in range(5):
             day = now + timedelta(days=i)
-            day_name = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'][day.weekday()]
+            day_name = _DAY_NAMES[day.weekday()]
 
             # Today gets a special name
             if i == 0:
@@ -1618,6 +1870,49 @@ class DashboardGenerator:
 
         return agenda
 
+    def _get_mock_week_events(self) -> Dict[str, Dict]:
+        """Return mock week calendar events for testing, built once per day"""
+        now = datetime.now()
+        today = now.date()
+        if self._mock_week_cache[0] == today:
+            return self._mock_week_cache[1]
+
+        monday = now - timedelta(days=now.weekday())
+
+        mock_week_events = {}
+        for i in range(7):
+            day = monday + timedelta(days=i)
+            day_date = day.date()
+            mock_week_events[day_date.isoformat()] = {
+                'date': day,
+                'day_name': _DAY_ABBR[i],
+                'day_number': day.day,
+                'is_today': day_date == today,
+                'all_day': [],
+                'timed': []
+            }
+
+        # Add some mock events
+        today_key = today.isoformat()
+        tomorrow_key = (today + timedelta(days=1)).isoformat()
+
+        if today_key in mock_week_events:
+            mock_week_events[today_key]['timed'].extend([
+                {'summary': 'Team Standup', 'start': '09:00', 'end': '09:30', 'type': 'timed', 'calendar_name': 'Work', 'calendar_color': '#0F9D58'},
+                {'summary': 'Project Review', 'start': '14:00', 'end': '15:00', 'type': 'timed', 'calendar_name': 'Work', 'calendar_color': '#0F9D58'}
+            ])
+            mock_week_events[today_key]['all_day'].append(
+                {'summary': 'Holiday', 'type': 'all_day', 'calendar_name': 'Personal', 'calendar_color': '#4285F4'}
+            )
+
+        if tomorrow_key in mock_week_events:
+            mock_week_events[tomorrow_key]['timed'].append(
+                {'summary': 'Client Call', 'start': '16:00', 'end': '17:00', 'type': 'timed', 'calendar_name': 'Personal', 'calendar_color': '#4285F4'}
+            )
+
+        self._mock_week_cache = (today, mock_week_events)
+        return mock_week_events
+
     def _get_mock_traffic_data(self) -> Dict:
         """Return mock traffic data for testing"""
         return {
@@ -1664,9 +1959,9 @@ class DashboardGenerator:
                 'limit': 1
             }
 
-            geo_response = requests.get(geocoding_url, params=geo_params, timeout=10)
+            geo_response = self._session.get(geocoding_url, params=geo_params, timeout=10)
             geo_response.raise_for_status()
-            geo_data = geo_response.json()
+            geo_data = orjson.loads(geo_response.content)
 
             if not geo_data:
                 logger.warning(f"Could not find coordinates for location: {location}")
@@ -1682,9 +1977,9 @@ class DashboardGenerator:
                 'appid': config['api_key']
             }
 
-            aqi_response = requests.get(aqi_url, params=aqi_params, timeout=10)
+            aqi_response = self._session.get(aqi_url, params=aqi_params, timeout=10)
             aqi_response.raise_for_status()
-            aqi_data = aqi_response.json()
+            aqi_data = orjson.loads(aqi_response.content)
 
             # Extract air quality index and convert to status
             aqi_value = aqi_data['list'][0]['main']['aqi']
@@ -1769,58 +2064,41 @@ class DashboardGenerator:
                 'units': config.get('units', os.getenv('WEATHER_UNITS', 'imperial'))
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
-            # Process forecast data - group by day and get daily highs/lows
+            # Process forecast data - group by day and get daily highs/lows in a single pass
             forecast_days = {}
-            day_names = ['MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN']
             local_tz = self._get_configured_timezone()
             current_time = datetime.now(local_tz)
+            today = current_time.date()
 
             for item in data['list'][:40]:  # 5 days * 8 (3-hour intervals)
                 dt = datetime.fromtimestamp(item['dt'], tz=local_tz)
-                day_key = dt.strftime('%Y-%m-%d')
-                today = current_time.date()
                 item_date = dt.date()
 
                 # For today, only include future forecast data
                 if item_date == today and dt <= current_time:
                     continue
 
-                if day_key not in forecast_days:
-                    # Determine day name
-                    if item_date == today:
-                        day_name = 'TODAY'
-                    else:
-                        day_name = day_names[dt.weekday()]
-
-                    forecast_days[day_key] = {
-                        'day': day_name,
-                        'icon': item['weather'][0]['icon'],
-                        'description': item['weather'][0]['description'],
-                        'high': round(item['main']['temp']),
-                        'low': round(item['main']['temp']),
-                        'temps': [round(item['main']['temp'])]
+                temp = round(item['main']['temp'])
+                day_data = forecast_days.get(item_date)
+                if day_data is None:
+                    weather = item['weather'][0]
+                    forecast_days[item_date] = {
+                        'day': 'TODAY' if item_date == today else _FORECAST_DAY_NAMES[dt.weekday()],
+                        'icon': weather['icon'],
+                        'description': weather['description'],
+                        'high': temp,
+                        'low': temp
                     }
-                else:
-                    # Update high/low and collect temps
-                    temp = round(item['main']['temp'])
-                    forecast_days[day_key]['temps'].append(temp)
-                    forecast_days[day_key]['high'] = max(forecast_days[day_key]['high'], temp)
-                    forecast_days[day_key]['low'] = min(forecast_days[day_key]['low'], temp)
-
-            # Convert to list and calculate temperature range for bars
-            forecast_list = []
-            for day_data in list(forecast_days.values())[:5]:
-                forecast_list.append({
-                    'day': day_data['day'],
-                    'icon': day_data['icon'],
-                    'description': day_data['description'],
-                    'high': day_data['high'],
-                    'low': day_data['low']
-                })
+                elif temp > day_data['high']:
+                    day_data['high'] = temp
+                elif temp < day_data['low']:
+                    day_data['low'] = temp
+
+            forecast_list = list(forecast_days.values())[:5]
 
             # Calculate week temperature range for bar visualization
             all_temps = []
@@ -1847,35 +2125,69 @@ class DashboardGenerator:
 
             return forecast_list
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Forecast fetch failed: {e}")
             return None
 
+    def _fetch_rss_feed(self, name: str, url: str, max_items: int) -> List[Dict]:
+        """Download and parse a single RSS feed"""
+        try:
+            logger.info(f"Fetching RSS feed: {name}")
+            response = self._session.get(
+                url,
+                headers={'User-Agent': RSS_USER_AGENT},
+                timeout=10,
+                expire_after=self.RSS_CACHE_EXPIRY
+            )
+            response.raise_for_status()
+            feed = fastfeedparser.parse(response.content, include_tags=False, include_media=False,
+                                        include_enclosures=False)
+
+            articles = []
+            for entry in feed.entries[:max_items]:
+                summary = entry.get('summary') or entry.get('description', '')
+                articles.append({
+                    'source': name,
+                    'title': entry.title,
+                    'link': entry.get('link', '#'),
+                    'published': entry.get('published', ''),
+                    'summary': summary[:200] + '...' if summary else ''
+                })
+            return articles
+        except Exception as e:
+            logger.error(f"Failed to fetch RSS feed {name}: {e}")
+            return []
+
     def fetch_rss_feeds(self) -> List[Dict]:
-        """Fetch RSS feed entries"""
-        all_articles = []
+        """Fetch RSS feed entries, downloading all feeds concurrently"""
         feeds = self.config.get('rss_feeds', {})
+        if not feeds:
+            return []
 
-        for name, url in feeds.items():
-            try:
-                logger.info(f"Fetching RSS feed: {name}")
-                feed = feedparser.parse(url)
-
-                # Get configured number of articles per feed
-                max_items = self.config.get('rss_settings', {}).get('items_per_feed', 3)
-
-                for entry in feed.entries[:max_items]:
-                    all_articles.append({
-                        'source': name,
-                        'title': entry.title,
-                        'link': entry.get('link', '#'),
-                        'published': entry.get('published', ''),
-                        'summary': entry.get('summary', '')[:200] + '...' if entry.get('summary') else ''
-                    })
-            except Exception as e:
-                logger.error(f"Failed to fetch RSS feed {name}: {e}")
-
-        return all_articles
+        # Get configured number of articles per feed
+        max_items = self.config.get('rss_settings', {}).get('items_per_feed', 3)
+
+        with ThreadPoolExecutor(max_workers=min(len(feeds), self.RSS_FETCH_WORKERS)) as executor:
+            results = executor.map(lambda feed: self._fetch_rss_feed(feed[0], feed[1], max_items), feeds.items())
+            return [article for articles in results for article in articles]
+
+    def _get_calendars(self, calendar_config: Dict) -> Dict[str, Dict]:
+        """Return configured calendars, converting the legacy single calendar_id format"""
+        calendars = calendar_config.get('calendars', {})
+        if calendars:
+            return calendars
+
+        for legacy_key in ('calendar_id', '_legacy_calendar_id'):
+            if legacy_key in calendar_config:
+                return {
+                    'primary': {
+                        'id': calendar_config[legacy_key],
+                        'name': 'Calendar',
+                        'color': '#4285F4',
+                        'enabled': True
+                    }
+                }
+        return {}
 
     def fetch_calendar_events(self) -> List[Dict]:
         """Fetch calendar events from Google Calendar or return mock data"""
@@ -1890,29 +2202,7 @@ class DashboardGenerator:
         if not calendar_config.get('use_mock_data', True) and self.calendar_service:
             try:
                 all_events = []
-                
-                # Handle both new multi-calendar config and legacy single calendar
-                calendars = calendar_config.get('calendars', {})
-                
-                # Legacy fallback - convert old calendar_id to new format
-                if not calendars and 'calendar_id' in calendar_config:
-                    calendars = {
-                        'primary': {
-                            'id': calendar_config['calendar_id'],
-                            'name': 'Calendar',
-                            'color': '#4285F4',
-                            'enabled': True
-                        }
-                    }
-                elif not calendars and '_legacy_calendar_id' in calendar_config:
-                    calendars = {
-                        'primary': {
-                            'id': calendar_config['_legacy_calendar_id'],
-                            'name': 'Calendar', 
-                            'color': '#4285F4',
-                            'enabled': True
-                        }
-                    }
+                calendars = self._get_calendars(calendar_config)
 
                 max_events_per_calendar = calendar_config.get('max_events_per_calendar', calendar_config.get('max_events', 5))
                 max_events_total = calendar_config.get('max_events_total', 15)
@@ -1969,28 +2259,7 @@ class DashboardGenerator:
         # Use real Google Calendar if configured
         if not calendar_config.get('use_mock_data', True) and self.calendar_service:
             try:
-                # Handle both new multi-calendar config and legacy single calendar
-                calendars = calendar_config.get('calendars', {})
-                
-                # Legacy fallback
-                if not calendars and 'calendar_id' in calendar_config:
-                    calendars = {
-                        'primary': {
-                            'id': calendar_config['calendar_id'],
-                            'name': 'Calendar',
-                            'color': '#4285F4',
-                            'enabled': True
-                        }
-                    }
-                elif not calendars and '_legacy_calendar_id' in calendar_config:
-                    calendars = {
-                        'primary': {
-                            'id': calendar_config['_legacy_calendar_id'],
-                            'name': 'Calendar',
-                            'color': '#4285F4',
-                            'enabled': True
-                        }
-                    }
+                calendars = self._get_calendars(calendar_config)
 
                 if not calendars:
                     logger.warning("No calendars configured")
@@ -1999,10 +2268,11 @@ class DashboardGenerator:
                 # Initialize agenda structure for next 5 days
                 agenda = []
                 now = datetime.now()
+                today = now.date()
                 
                 for i in range(5):
                     day = now + timedelta(days=i)
-                    day_name = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'][day.weekday()]
+                    day_name = _DAY_NAMES[day.weekday()]
 
                     if i == 0:
                         display_name = 'Today'
@@ -2031,19 +2301,11 @@ class DashboardGenerator:
                     
                     try:
                         # Get raw events for proper date parsing
-                        time_min = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-                        time_max = time_min + timedelta(days=5)
-                        
-                        events_result = self.calendar_service.service.events().list(
-                            calendarId=calendar_id,
-                            timeMin=time_min.isoformat() + 'Z',
-                            timeMax=time_max.isoformat() + 'Z',
-                            maxResults=calendar_config.get('max_events_per_calendar', 10),
-                            singleEvents=True,
-                            orderBy='startTime'
-                        ).execute()
-
-                        raw_events = events_result.get('items', [])
+                        raw_events = self.calendar_service.list_events(
+                            calendar_id,
+                            *GoogleCalendarService.days_ahead_window(5),
+                            calendar_config.get('max_events_per_calendar', 10)
+                        )
                         logger.info(f"Fetched {len(raw_events)} agenda events from calendar '{calendar_name}'")
 
                         # Process each raw event and place in correct agenda day
@@ -2053,15 +2315,13 @@ class DashboardGenerator:
 
                             # Determine event date and format
                             if 'T' in start:
-                                # Timed event
-                                start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                                end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                                event_date = start_dt.date()
+                                # Timed event: slice date and HH:MM from the ISO string (event's own offset)
+                                event_date = datetime.fromisoformat(start[:10]).date()
 
                                 event_data = {
                                     'summary': event.get('summary', 'Untitled Event'),
-                                    'start': start_dt.strftime('%H:%M'),
-                                    'end': end_dt.strftime('%H:%M'),
+                                    'start': _iso_time(start),
+                                    'end': _iso_time(end),
                                     'type': 'timed',
                                     'calendar_name': calendar_name,
                                     'calendar_color': calendar_color,
@@ -2082,7 +2342,6 @@ class DashboardGenerator:
                                 }
 
                             # Find the matching agenda day
-                            today = now.date()
                             days_ahead = (event_date - today).days
 
                             if 0 <= days_ahead < 5:
@@ -2116,28 +2375,7 @@ class DashboardGenerator:
         # Use real Google Calendar if configured
         if not calendar_config.get('use_mock_data', True) and self.calendar_service:
             try:
-                # Handle both new multi-calendar config and legacy single calendar
-                calendars = calendar_config.get('calendars', {})
-                
-                # Legacy fallback
-                if not calendars and 'calendar_id' in calendar_config:
-                    calendars = {
-                        'primary': {
-                            'id': calendar_config['calendar_id'],
-                            'name': 'Calendar',
-                            'color': '#4285F4',
-                            'enabled': True
-                        }
-                    }
-                elif not calendars and '_legacy_calendar_id' in calendar_config:
-                    calendars = {
-                        'primary': {
-                            'id': calendar_config['_legacy_calendar_id'],
-                            'name': 'Calendar',
-                            'color': '#4285F4',
-                            'enabled': True
-                        }
-                    }
+                calendars = self._get_calendars(calendar_config)
 
                 # Initialize combined week structure
                 combined_week_events = {}
@@ -2176,42 +2414,7 @@ class DashboardGenerator:
 
         # Return mock data as fallback for current week
         logger.info("Using mock week calendar data")
-        now = datetime.now()
-        monday = now - timedelta(days=now.weekday())
-
-        mock_week_events = {}
-        for i in range(7):
-            day = monday + timedelta(days=i)
-            date_key = day.strftime('%Y-%m-%d')
-            mock_week_events[date_key] = {
-                'date': day,
-                'day_name': ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'][i],
-                'day_number': day.day,
-                'is_today': day.date() == now.date(),
-                'all_day': [],
-                'timed': []
-            }
-
-        # Add some mock events
-        today_key = now.strftime('%Y-%m-%d')
-        tomorrow = now + timedelta(days=1)
-        tomorrow_key = tomorrow.strftime('%Y-%m-%d')
-
-        if today_key in mock_week_events:
-            mock_week_events[today_key]['timed'].extend([
-                {'summary': 'Team Standup', 'start': '09:00', 'end': '09:30', 'type': 'timed', 'calendar_name': 'Work', 'calendar_color': '#0F9D58'},
-                {'summary': 'Project Review', 'start': '14:00', 'end': '15:00', 'type': 'timed', 'calendar_name': 'Work', 'calendar_color': '#0F9D58'}
-            ])
-            mock_week_events[today_key]['all_day'].append(
-                {'summary': 'Holiday', 'type': 'all_day', 'calendar_name': 'Personal', 'calendar_color': '#4285F4'}
-            )
-
-        if tomorrow_key in mock_week_events:
-            mock_week_events[tomorrow_key]['timed'].append(
-                {'summary': 'Client Call', 'start': '16:00', 'end': '17:00', 'type': 'timed', 'calendar_name': 'Personal', 'calendar_color': '#4285F4'}
-            )
-
-        return mock_week_events
+        return self._get_mock_week_events()
 
     def _format_events_for_ticker(self, events: List[Dict]) -> List[Dict]:
         """Format calendar events for the ticker display"""
@@ -2270,8 +2473,7 @@ class DashboardGenerator:
                 'timestamp': datetime.now().isoformat(),
                 'events': events
             }
-            with open(cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            cache_file.write_bytes(orjson.dumps(cache_data, option=orjson.OPT_INDENT_2))
             logger.debug(f"Calendar cache saved with {len(events)} events")
         except Exception as e:
             logger.warning(f"Failed to save calendar cache: {e}")
@@ -2283,8 +2485,7 @@ class DashboardGenerator:
             if not cache_file.exists():
                 return []
 
-            with open(cache_file, 'r') as f:
-                cache_data = json.load(f)
+            cache_data = orjson.loads(cache_file.read_bytes())
 
             # Check if cache is recent (within 24 hours)
             cache_time = datetime.fromisoformat(cache_data['timestamp'])
@@ -2300,17 +2501,61 @@ class DashboardGenerator:
             logger.warning(f"Failed to load calendar cache: {e}")
             return []
 
+    def _get_month_days(self, now: datetime) -> Tuple[CalendarDay, ...]:
+        """Build the month grid with previous/next month days"""
+        return _build_month_days(now.year, now.month, now.day)
+
+    def _get_time_fields(self, now: datetime) -> Dict:
+        """Clock fields for the dashboard template"""
+        return {
+            'current_time': now.strftime('%H:%M'),
+            'last_updated': now.strftime('%H:%M:%S'),
+            'cache_buster': int(now.timestamp())
+        }
+
+    def _hash_template_data(self, template_data: Dict) -> bytes:
+        """Hash the template inputs, ignoring fields that only track the current time"""
+        stable_data = {key: value for key, value in template_data.items()
+                       if key not in self.VOLATILE_TEMPLATE_KEYS}
+        serialized = orjson.dumps(stable_data, default=str,
+                                  option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        return hashlib.blake2b(serialized, digest_size=16).digest()
+
+    @contextmanager
+    def _atomic_output(self, path: Path):
+        """Open a temp file for writing and rename it over path so readers never see a partial file"""
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                yield f
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     def copy_static_files(self):
         """Copy static files to output directory"""
         try:
-            if self.static_dir.exists():
-                # Copy all files from src/static to output/static
-                for file_path in self.static_dir.glob('*'):
-                    if file_path.is_file():
-                        dest_path = self.output_static_dir / file_path.name
-                        shutil.copy2(file_path, dest_path)
-                        logger.debug(f"Copied {file_path} to {dest_path}")
-                logger.info(f"Static files copied to {self.output_static_dir}")
+            # Copy all files from src/static to output/static
+            copied = 0
+            for file_path in self._static_files:
+                dest_path = self.output_static_dir / file_path.name
+                # copy2 preserves mtime, so unchanged files match on size + mtime
+                src_stat = file_path.stat()
+                try:
+                    dest_stat = dest_path.stat()
+                    if (dest_stat.st_size == src_stat.st_size
+                            and dest_stat.st_mtime_ns == src_stat.st_mtime_ns):
+                        continue
+                except FileNotFoundError:
+                    pass
+                # On Linux copy2 copies the bytes in-kernel via os.sendfile
+                shutil.copy2(file_path, dest_path)
+                copied += 1
+                logger.debug(f"Copied {file_path} to {dest_path}")
+            logger.info(f"Static files copied to {self.output_static_dir} ({copied} updated)")
         except Exception as e:
             logger.error(f"Failed to copy static files: {e}")
 
@@ -2446,46 +2691,97 @@ class DashboardGenerator:
             logger.error(f"Failed to fetch Canvas assignment performance: {e}")
             return []
 
+    def _prefetch_calendar_events(self):
+        """Batch every calendar window used this run into one request so the fetches below hit the event cache"""
+        calendar_config = self.config.get('calendar', {})
+        if (self.test_mode or calendar_config.get('use_mock_data', True)
+                or not self.calendar_service or not self.calendar_service.service):
+            return
+
+        upcoming = GoogleCalendarService.days_ahead_window(7)
+        week = GoogleCalendarService.week_window()
+        agenda = GoogleCalendarService.days_ahead_window(5)
+        upcoming_max = calendar_config.get('max_events_per_calendar', calendar_config.get('max_events', 5))
+
+        windows = []
+        for cal_info in self._get_calendars(calendar_config).values():
+            if cal_info.get('enabled', True):
+                calendar_id = cal_info['id']
+                windows.append((calendar_id, *upcoming, upcoming_max))
+                windows.append((calendar_id, *week, GoogleCalendarService.WEEK_MAX_RESULTS))
+                # The agenda view reads its page size from each calendar's own settings
+                windows.append((calendar_id, *agenda, cal_info.get('max_events_per_calendar', 10)))
+
+        try:
+            self.calendar_service.prefetch_events(windows)
+        except Exception as e:
+            logger.warning(f"Batched calendar prefetch failed, fetching individually: {e}")
+
+    def _fetch_calendar_data(self) -> tuple:
+        """Fetch today, week and agenda calendar data in sequence
+
+        The Google API client is not thread-safe, so all calendar calls share one worker.
+        """
+        self._prefetch_calendar_events()
+        return (
+            self.fetch_calendar_events(),
+            self.fetch_week_calendar_events(),
+            self.fetch_agenda_events()
+        )
+
+    def _fetch_all_data(self) -> Dict:
+        """Fetch every data source concurrently so the fetch phase takes as long as the slowest source"""
+        fetchers = {
+            'weather': self.fetch_weather,
+            'forecast': self.fetch_forecast,
+            'articles': self.fetch_rss_feeds,
+            'calendar': self._fetch_calendar_data,
+            'canvas_assignments': self.fetch_canvas_assignments,
+            'canvas_announcements': self.fetch_canvas_announcements,
+            'canvas_grading_queue': self.fetch_canvas_grading_queue,
+            'canvas_student_engagement': self.fetch_canvas_student_engagement,
+            'canvas_discussion_hotspots': self.fetch_canvas_discussion_hotspots,
+            'canvas_assignment_performance': self.fetch_canvas_assignment_performance,
+            'air_quality': self.fetch_air_quality,
+            'traffic_data': self.fetch_traffic_data
+        }
+
+        with ThreadPoolExecutor(max_workers=self.FETCH_WORKERS) as executor:
+            futures = {name: executor.submit(fetcher) for name, fetcher in fetchers.items()}
+            return {name: future.result() for name, future in futures.items()}
+
     def generate_dashboard(self):
         """Generate the dashboard HTML"""
         try:
             # Copy static files first
             self.copy_static_files()
 
-            # Fetch all data
+            # Fetch all data concurrently
             logger.info("Fetching dashboard data...")
-            weather = self.fetch_weather()
-            forecast = self.fetch_forecast()
-            articles = self.fetch_rss_feeds()
-            events = self.fetch_calendar_events()
-            week_events = self.fetch_week_calendar_events()
-            agenda_events = self.fetch_agenda_events()
-            canvas_assignments = self.fetch_canvas_assignments()
-            canvas_announcements = self.fetch_canvas_announcements()
-            canvas_grading_queue = self.fetch_canvas_grading_queue()
-            canvas_student_engagement = self.fetch_canvas_student_engagement()
-            canvas_discussion_hotspots = self.fetch_canvas_discussion_hotspots()
-            canvas_assignment_performance = self.fetch_canvas_assignment_performance()
+            data = self._fetch_all_data()
+            weather = data['weather']
+            forecast = data['forecast']
+            articles = data['articles']
+            events, week_events, agenda_events = data['calendar']
+            canvas_assignments = data['canvas_assignments']
+            canvas_announcements = data['canvas_announcements']
+            canvas_grading_queue = data['canvas_grading_queue']
+            canvas_student_engagement = data['canvas_student_engagement']
+            canvas_discussion_hotspots = data['canvas_discussion_hotspots']
+            canvas_assignment_performance = data['canvas_assignment_performance']
+            air_quality = data['air_quality']
+            traffic_data = data['traffic_data']
 
             # Get current date/time info
             now = datetime.now()
-            day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            month_names = ['January', 'February', 'March', 'April', 'May', 'June',
-                          'July', 'August', 'September', 'October', 'November', 'December']
 
             # Calculate week info for calendar
             monday = now - timedelta(days=now.weekday())
-            week_start_date = f"{month_names[monday.month - 1]} {monday.day}"
-            current_month = month_names[now.month - 1]
+            week_start_date = f"{_MONTH_NAMES[monday.month - 1]} {monday.day}"
+            current_month = _MONTH_NAMES[now.month - 1]
             current_year = now.year
             week_number = now.isocalendar()[1]
 
-            # Air quality data (real or mock)
-            air_quality = self.fetch_air_quality()
-            
-            # Traffic data (map and travel times)
-            traffic_data = self.fetch_traffic_data()
-            
             # Traffic map configuration
             traffic_map = self.config.get('traffic_map', {
                 'center_lat': 36.133269983139876,
@@ -2504,58 +2800,8 @@ class DashboardGenerator:
             # Add UV level text
             uv_level = 'High' if weather and weather.get('uv_index', 6) > 5 else 'Moderate'
 
-            # Generate enhanced calendar month days with previous/next month days
-            month_days = []
-            import calendar as cal
-
-            # Get calendar grid for current month
-            month_cal = cal.monthcalendar(now.year, now.month)
-
-            # Calculate previous and next month info
-            if now.month == 1:
-                prev_month, prev_year = 12, now.year - 1
-            else:
-                prev_month, prev_year = now.month - 1, now.year
-
-            if now.month == 12:
-                next_month, next_year = 1, now.year + 1
-            else:
-                next_month, next_year = now.month + 1, now.year
-
-            # Get number of days in previous month
-            prev_month_days = cal.monthrange(prev_year, prev_month)[1]
-
-            # Calculate how many days from previous month to show
-            first_week = month_cal[0]
-            prev_month_start_day = prev_month_days - (6 - first_week.index(1)) if 1 in first_week else prev_month_days
-
-            next_month_day = 1
-
-            for week_idx, week in enumerate(month_cal):
-                for day_idx, day in enumerate(week):
-                    if day == 0:
-                        # This is an empty slot, determine if it's previous or next month
-                        if week_idx == 0:  # First week, so it's previous month
-                            prev_day = prev_month_start_day + day_idx + 1
-                            month_days.append({
-                                'number': prev_day,
-                                'is_today': False,
-                                'is_other_month': True
-                            })
-                        else:  # Later weeks, so it's next month
-                            month_days.append({
-                                'number': next_month_day,
-                                'is_today': False,
-                                'is_other_month': True
-                            })
-                            next_month_day += 1
-                    else:
-                        # This is a day in current month
-                        month_days.append({
-                            'number': day,
-                            'is_today': day == now.day,
-                            'is_other_month': False
-                        })
+            # Generate enhanced calendar month days (cached until the date rolls over)
+            month_days = self._get_month_days(now)
 
             # Calculate week temperature range for template if forecast is available
             week_temp_min = 60
@@ -2586,15 +2832,12 @@ class DashboardGenerator:
                 'events': events,
                 'week_events': week_events,
                 'agenda_events': agenda_events,
-                'current_time': now.strftime('%H:%M'),
-                'day_name': day_names[now.weekday()],
-                'date_info': f"{month_names[now.month - 1]} {now.day}",
+                'day_name': _DAY_NAMES[now.weekday()],
+                'date_info': f"{current_month} {now.day}",
                 'current_month': current_month,
                 'current_year': current_year,
                 'week_start_date': week_start_date,
                 'week_number': week_number,
-                'last_updated': now.strftime('%H:%M:%S'),
-                'cache_buster': int(now.timestamp()),
                 'config': self.config.get('display', {}),
                 'air_quality': air_quality,
                 'traffic_map': traffic_data.get('traffic_map', traffic_map),
@@ -2611,19 +2854,30 @@ class DashboardGenerator:
                 'canvas_grading_queue': canvas_grading_queue,
                 'canvas_student_engagement': canvas_student_engagement,
                 'canvas_discussion_hotspots': canvas_discussion_hotspots,
-                'canvas_assignment_performance': canvas_assignment_performance
+                'canvas_assignment_performance': canvas_assignment_performance,
+                **self._get_time_fields(now)
             }
 
-            # Render template
-            logger.info("Rendering dashboard template...")
-            env = Environment(loader=FileSystemLoader(self.template_dir))
-            template = env.get_template('dashboard.html')
-            html_content = template.render(template_data)
-
-            # Write output
+            # Skip rendering when nothing but the clock has changed since the last run
             output_path = self.output_dir / 'index.html'
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            stable_hash = self._hash_template_data(template_data)
+            if stable_hash == self._last_stable_hash and output_path.exists():
+                logger.info("Dashboard unchanged, skipping render")
+                return True
+
+            # Render template, streaming chunks straight into the output file
+            logger.info("Rendering dashboard template...")
+            with self._atomic_output(output_path) as f:
+                self._dashboard_template.stream(template_data).dump(f, encoding='utf-8')
+
+            # Precompress for nginx gzip_static so the page isn't compressed on every request
+            gzip_path = output_path.with_name(output_path.name + '.gz')
+            with self._atomic_output(gzip_path) as f, open(output_path, 'rb') as src, \
+                    gzip.GzipFile(fileobj=f, mode='wb', compresslevel=6, mtime=0) as gz:
+                shutil.copyfileobj(src, gz)
+            self._last_stable_hash = stable_hash
+            self._last_render_ts = template_data['cache_buster']
+            self.generate_time_strip()
 
             logger.info(f"Dashboard generated successfully: {output_path}")
             return True
@@ -2632,11 +2886,40 @@ class DashboardGenerator:
             logger.error(f"Dashboard generation failed: {e}")
             return False
 
+    def generate_time_strip(self):
+        """Write the small time.json fragment the page polls to learn about a newer render"""
+        try:
+            with self._atomic_output(self.output_dir / 'time.json') as f:
+                self._time_strip_template.stream(generated=self._last_render_ts).dump(f, encoding='utf-8')
+            return True
+
+        except Exception as e:
+            logger.error(f"Time strip generation failed: {e}")
+            return False
+
+
+def lower_process_priority():
+    """Pin to the last CPU and lower CPU/IO priority so update spikes don't stall the kiosk browser"""
+    try:
+        os.sched_setaffinity(0, {max(os.sched_getaffinity(0))})
+    except (AttributeError, OSError) as e:
+        logger.debug(f"Could not pin CPU affinity: {e}")
+
+    try:
+        os.nice(10)
+    except (AttributeError, OSError) as e:
+        logger.debug(f"Could not lower CPU priority: {e}")
+
+    try:
+        subprocess.run(['ionice', '-c', '2', '-n', '7', '-p', str(os.getpid())],
+                       check=False, capture_output=True)
+    except OSError as e:
+        logger.debug(f"Could not lower IO priority: {e}")
+
 
 def main():
     """Main entry point"""
     import argparse
-    import time
     import signal
 
     parser = argparse.ArgumentParser(description='Dashboard Generator')
@@ -2648,13 +2931,14 @@ def main():
                        help='Use mock data instead of real API calls')
     args = parser.parse_args()
 
-    generator = DashboardGenerator()
+    generator = DashboardGenerator(refresh_interval=args.interval)
     
     # Set test mode if requested
     generator.test_mode = args.test
 
     if args.loop:
         logger.info(f"Starting dashboard generator in loop mode (interval: {args.interval}s)")
+        lower_process_priority()
 
         # Set up signal handling for graceful shutdown
         def signal_handler(signum, frame):
@@ -2664,8 +2948,9 @@ def main():
         signal.signal(signal.SIGTERM, signal_handler)
         signal.signal(signal.SIGINT, signal_handler)
 
-        # Main loop
+        # Main loop, scheduled against a monotonic clock so update times don't drift
         try:
+            next_tick = time.monotonic()
             while True:
                 try:
                     logger.info("Generating dashboard...")
@@ -2675,8 +2960,14 @@ def main():
                     else:
                         logger.error("Dashboard generation failed")
 
-                    logger.info(f"Waiting {args.interval} seconds until next update...")
-                    time.sleep(args.interval)
+                    next_tick += args.interval
+                    delay = next_tick - time.monotonic()
+                    if delay < 0:
+                        logger.warning(f"Dashboard update overran the interval by {-delay:.1f}s")
+                        next_tick = time.monotonic()
+                    else:
+                        logger.info(f"Waiting {delay:.0f} seconds until next update...")
+                        time.sleep(delay)
 
                 except KeyboardInterrupt:
                     logger.info("Keyboard interrupt received, shutting down...")
@@ -2685,6 +2976,7 @@ def main():
                     logger.error(f"Error in loop: {e}")
                     logger.info("Waiting 60 seconds before retrying...")
                     time.sleep(60)
+                    next_tick = time.monotonic()
 
         except Exception as e:
             logger.error(f"Fatal error: {e}")